@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+"""
+Pre-warmed runtime for SPADE lab agents.
+
+Importing spade (and the XMPP stack behind it) dominates the life of a short
+agent like labs/lab01/basic_agent.py. This daemon pays that cost once: it
+imports spade, colorama and every lab script up front, then listens on a local
+socket for requests to start agents inside the already-initialized process.
+
+Usage:
+    python agent_runtime.py serve
+    python agent_runtime.py spawn labs/lab01/basic_agent.py BasicAgent student@localhost
+    python agent_runtime.py stop student@localhost
+    python agent_runtime.py list
+
+Only agent classes defined in the lab scripts loaded at warm-up can be spawned.
+
+Requests are newline-delimited JSON, one request and one reply per connection:
+    {"cmd": "spawn", "path": "...", "class": "...", "jid": "...", "password": "..."}
+    {"cmd": "stop", "jid": "..."}
+    {"cmd": "list"}
+
+For a full per-module breakdown of where startup time goes, run any lab with
+`python -X importtime labs/labXX/<script>.py`.
+"""
+import argparse
+import asyncio
+import importlib
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+HOST = "127.0.0.1"
+PORT = 5230
+
+ROOT = Path(__file__).resolve().parent
+
+# How long (seconds) a spawned agent gets to connect before the request fails
+SPAWN_TIMEOUT = 5
+
+# Heavy dependencies every lab script pulls in
+PRELOAD_MODULES = ["spade.agent", "spade.behaviour", "spade.message", "colorama"]
+
+# Lab scripts already imported by this process, keyed by resolved path
+LOADED_SCRIPTS = {}
+
+# Agents started by this process, keyed by JID
+RUNNING_AGENTS = {}
+
+# JIDs with a spawn in progress, so concurrent requests can't start one twice
+STARTING_AGENTS = set()
+
+
+def timed_import(name):
+    """Import a module by name and return how long it took in milliseconds"""
+    start = time.perf_counter()
+    importlib.import_module(name)
+    return (time.perf_counter() - start) * 1000
+
+
+def load_script(path):
+    """Import a lab script by file path, reusing it if it was loaded before"""
+    path = (ROOT / path).resolve()
+    if path in LOADED_SCRIPTS:
+        return LOADED_SCRIPTS[path]
+
+    # e.g. labs/lab03/rescue_agent_fsm.py -> lab03_rescue_agent_fsm
+    name = f"{path.parent.name}_{path.stem}"
+    # Scripts import helpers from their own folder, as they would when run directly
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    LOADED_SCRIPTS[path] = module
+    return module
+
+
+def is_lab_script(path):
+    """Lab scripts are entry points; helpers and tests next to them are not"""
+    if path.name.startswith("test_"):
+        return False
+    return 'if __name__ == "__main__":' in path.read_text(encoding="utf-8")
+
+
+def warm_up():
+    """Import dependencies and lab scripts, printing the time each one took"""
+    print("Warming up runtime...")
+    for name in PRELOAD_MODULES:
+        print(f"  {name:<40} {timed_import(name):8.1f} ms")
+
+    for path in sorted(ROOT.glob("labs/lab*/*.py")):
+        # Helpers like lab02/percept_store.py are imported by their script
+        if not is_lab_script(path):
+            continue
+        start = time.perf_counter()
+        try:
+            load_script(path)
+        except Exception as e:
+            print(f"  {path.relative_to(ROOT)!s:<40} skipped ({e})")
+            continue
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {path.relative_to(ROOT)!s:<40} {elapsed:8.1f} ms")
+
+    from colorama import init
+    init(autoreset=True)
+
+
+def find_agent_class(path, class_name):
+    """Look up an agent class in a lab script loaded at warm-up
+
+    Requests never import new code: anything outside LOADED_SCRIPTS, or any
+    attribute that isn't an Agent subclass defined in that script, is rejected.
+    """
+    from spade.agent import Agent
+
+    module = LOADED_SCRIPTS.get((ROOT / path).resolve())
+    if module is None:
+        raise ValueError(f"{path} is not a lab script loaded by this runtime")
+    agent_class = getattr(module, class_name, None)
+    if not (
+        isinstance(agent_class, type)
+        and issubclass(agent_class, Agent)
+        and agent_class.__module__ == module.__name__
+    ):
+        raise ValueError(f"{class_name} is not an agent class in {path}")
+    return agent_class
+
+
+async def spawn_agent(request):
+    start = time.perf_counter()
+    jid = request["jid"]
+    existing = RUNNING_AGENTS.get(jid)
+    if jid in STARTING_AGENTS or (existing is not None and existing.is_alive()):
+        return {"status": "error", "error": f"{jid} is already running"}
+
+    agent_class = find_agent_class(request["path"], request["class"])
+    # Reserve the JID before the first await so a concurrent spawn sees it
+    STARTING_AGENTS.add(jid)
+    try:
+        agent = agent_class(jid, request.get("password", "password"))
+        await asyncio.wait_for(agent.start(auto_register=True), SPAWN_TIMEOUT)
+        RUNNING_AGENTS[jid] = agent
+    except asyncio.TimeoutError:
+        return {"status": "error", "error": f"{jid} did not come online within {SPAWN_TIMEOUT}s - is the XMPP server running?"}
+    finally:
+        STARTING_AGENTS.discard(jid)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"[SPAWN] {request['class']} {jid} online in {elapsed:.1f} ms")
+    return {"status": "online", "jid": jid, "elapsed_ms": round(elapsed, 1)}
+
+
+async def stop_agent(request):
+    agent = RUNNING_AGENTS.pop(request["jid"], None)
+    if agent is None:
+        return {"status": "error", "error": f"{request['jid']} is not running"}
+    await agent.stop()
+    print(f"[STOP] {request['jid']}")
+    return {"status": "stopped", "jid": request["jid"]}
+
+
+async def list_agents(request):
+    # Forget agents that have already stopped themselves
+    for jid in [jid for jid, agent in RUNNING_AGENTS.items() if not agent.is_alive()]:
+        del RUNNING_AGENTS[jid]
+    return {"status": "ok", "agents": sorted(RUNNING_AGENTS)}
+
+
+HANDLERS = {
+    "spawn": spawn_agent,
+    "stop": stop_agent,
+    "list": list_agents,
+}
+
+
+async def handle_client(reader, writer):
+    try:
+        request = json.loads(await reader.readline())
+        handler = HANDLERS.get(request.get("cmd"))
+        if handler is None:
+            reply = {"status": "error", "error": f"unknown command: {request.get('cmd')}"}
+        else:
+            reply = await handler(request)
+    except Exception as e:
+        reply = {"status": "error", "error": str(e)}
+
+    writer.write((json.dumps(reply) + "\n").encode())
+    await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+async def serve(host, port):
+    warm_up()
+    server = await asyncio.start_server(handle_client, host, port)
+
+    print("=" * 60)
+    print("Agent runtime ready")
+    print("=" * 60)
+    print(f"Listening on {host}:{port}")
+    print("=" * 60)
+    print("\nPress Ctrl+C to stop the runtime\n")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for agent in RUNNING_AGENTS.values():
+            await agent.stop()
+
+
+async def send_request(host, port, request):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write((json.dumps(request) + "\n").encode())
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return reply
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-warmed runtime for SPADE lab agents")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    commands = parser.add_subparsers(dest="cmd", required=True)
+
+    commands.add_parser("serve", help="start the runtime daemon")
+
+    spawn = commands.add_parser("spawn", help="start an agent in the runtime")
+    spawn.add_argument("path", help="lab script defining the agent class")
+    spawn.add_argument("agent_class", help="agent class name, e.g. BasicAgent")
+    spawn.add_argument("jid")
+    spawn.add_argument("--password", default="password")
+
+    stop = commands.add_parser("stop", help="stop an agent running in the runtime")
+    stop.add_argument("jid")
+
+    commands.add_parser("list", help="list agents running in the runtime")
+
+    args = parser.parse_args()
+
+    if args.cmd == "serve":
+        asyncio.run(serve(args.host, args.port))
+        return
+
+    request = {"cmd": args.cmd}
+    if args.cmd == "spawn":
+        request.update({
+            "path": args.path,
+            "class": args.agent_class,
+            "jid": args.jid,
+            "password": args.password,
+        })
+    elif args.cmd == "stop":
+        request["jid"] = args.jid
+
+    try:
+        reply = asyncio.run(send_request(args.host, args.port, request))
+    except ConnectionRefusedError:
+        print(f"Runtime is not running on {args.host}:{args.port} - start it with: python agent_runtime.py serve")
+        sys.exit(1)
+    print(json.dumps(reply, indent=2))
+    if reply.get("status") == "error":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
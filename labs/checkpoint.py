@@ -0,0 +1,125 @@
+"""
+Checkpoint/restore support shared by the lab agents.
+
+A CheckpointedAgent snapshots the attributes named in `checkpoint_fields` to
+checkpoints/<agent>.ckpt next to the script that defines it, every
+CHECKPOINT_INTERVAL seconds from a background task and again on stop(). A
+restarted agent picks the snapshot back up so it continues where it left off.
+Agents with state that isn't a plain attribute override snapshot() and
+restore().
+
+Lab scripts import this from the parent labs/ folder:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from checkpoint import CheckpointedAgent
+"""
+
+import asyncio
+import inspect
+import os
+import pickle
+from pathlib import Path
+
+from colorama import Fore, Style
+from spade.agent import Agent
+
+CHECKPOINT_INTERVAL = 5  # seconds between periodic snapshots
+
+
+def load_checkpoint(path):
+    """Read a snapshot from disk, returning None when there isn't a usable one"""
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Truncated, corrupt or written by an incompatible version - start fresh
+        print(f"{Fore.YELLOW}⚠️  Ignoring unreadable checkpoint {path}: {e!r}{Style.RESET_ALL}")
+        return None
+
+
+def write_checkpoint(path, blob):
+    """Write to a temp file and swap it in so a crash never leaves a torn snapshot"""
+    path.parent.mkdir(exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+
+
+class CheckpointedAgent(Agent):
+    """Agent whose checkpoint_fields survive a restart"""
+
+    checkpoint_fields = ()
+
+    def __init__(self, jid, password, *args, **kwargs):
+        super().__init__(jid, password, *args, **kwargs)
+        script_dir = Path(inspect.getfile(type(self))).resolve().parent
+        self.checkpoint_path = script_dir / "checkpoints" / f"{str(jid).split('@')[0]}.ckpt"
+        self.checkpoint_lock = asyncio.Lock()
+        self.last_checkpoint = None
+        self.checkpoint_done = False
+        self.checkpoint_task = None
+        self.resumed = False
+
+    def snapshot(self):
+        """State to persist - the checkpoint_fields by default"""
+        return {field: getattr(self, field) for field in self.checkpoint_fields}
+
+    def restore(self, snapshot):
+        """Apply a snapshot; raise if it doesn't fit so nothing is half-applied"""
+        values = {field: snapshot[field] for field in self.checkpoint_fields}
+        for field, value in values.items():
+            setattr(self, field, value)
+
+    def start_checkpointing(self):
+        """Resume from the last snapshot, if any, and start periodic snapshots
+
+        Call from setup() once the agent's defaults are in place.
+        """
+        snapshot = load_checkpoint(self.checkpoint_path)
+        if snapshot is not None:
+            try:
+                self.restore(snapshot)
+                self.resumed = True
+            except Exception as e:
+                print(f"{Fore.YELLOW}⚠️  Ignoring incompatible checkpoint {self.checkpoint_path}: {e!r}{Style.RESET_ALL}")
+        # A plain task rather than a behaviour: spade queues every incoming
+        # message on each template-less behaviour, and this one never reads them
+        self.checkpoint_task = asyncio.create_task(self.checkpoint_loop())
+        return self.resumed
+
+    async def checkpoint_loop(self):
+        while True:
+            await asyncio.sleep(CHECKPOINT_INTERVAL)
+            try:
+                await self.save_checkpoint()
+            except Exception as e:
+                print(f"{Fore.YELLOW}⚠️  Checkpoint to {self.checkpoint_path} failed: {e!r}{Style.RESET_ALL}")
+
+    async def save_checkpoint(self):
+        blob = pickle.dumps(self.snapshot(), protocol=pickle.HIGHEST_PROTOCOL)
+        async with self.checkpoint_lock:
+            # Skip the write entirely if nothing changed since last time
+            if self.checkpoint_done or blob == self.last_checkpoint:
+                return
+            # Disk I/O happens off the event loop so behaviours aren't blocked
+            await asyncio.to_thread(write_checkpoint, self.checkpoint_path, blob)
+            self.last_checkpoint = blob
+
+    async def clear_checkpoint(self):
+        """Delete the snapshot after a planned finish so the next run starts fresh"""
+        async with self.checkpoint_lock:
+            self.checkpoint_done = True
+            self.checkpoint_path.unlink(missing_ok=True)
+
+    async def stop(self):
+        if self.checkpoint_task is not None:
+            # Cancel under the lock so a periodic write already in flight finishes first
+            async with self.checkpoint_lock:
+                self.checkpoint_task.cancel()
+            self.checkpoint_task = None
+        # Snapshot on shutdown before the behaviours are killed
+        await self.save_checkpoint()
+        await super().stop()
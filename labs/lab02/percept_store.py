@@ -0,0 +1,192 @@
+"""
+Columnar percept history for SensorAgent.
+
+Each percept is a fixed-width record of (timestamp, zone, severity). Records
+are appended to segment files, one file per column:
+
+    percepts/<agent>/seg-00000.ts    float64 unix timestamps
+    percepts/<agent>/seg-00000.zone  uint16 zone numbers
+    percepts/<agent>/seg-00000.sev   uint8 severity levels (0-4)
+
+A segment holds SEGMENT_SIZE records before a new one is started. Appends are
+packed with struct and flushed straight away, so recording percepts doesn't
+need numpy. Queries import numpy on first use, memory-map the column files
+and aggregate them in place, so millions of readings never become Python
+objects. A small in-memory index of each segment's first/last timestamp lets
+range queries skip whole segments, and binary search finds the exact bounds
+inside the ones that overlap.
+"""
+
+import struct
+from pathlib import Path
+
+SEGMENT_SIZE = 1_000_000
+
+# struct format of each column; numpy reads the same strings as dtypes
+COLUMNS = {
+    "ts": "<d",
+    "zone": "<H",
+    "sev": "<B",
+}
+ITEMSIZE = {col: struct.calcsize(fmt) for col, fmt in COLUMNS.items()}
+
+
+class Segment:
+    """One segment: a set of column files with the same number of records"""
+
+    def __init__(self, directory, number):
+        self.number = number
+        self.paths = {col: directory / f"seg-{number:05d}.{col}" for col in COLUMNS}
+        self.files = None
+        self.maps = None
+        # Number of complete records - a crash mid-append can leave the
+        # columns at different lengths, so trust the shortest one
+        self.count = min(
+            path.stat().st_size // ITEMSIZE[col] if path.exists() else 0
+            for col, path in self.paths.items()
+        )
+        self.first_ts = None
+        self.last_ts = None
+        if self.count:
+            with open(self.paths["ts"], "rb") as f:
+                (self.first_ts,) = struct.unpack(COLUMNS["ts"], f.read(ITEMSIZE["ts"]))
+                f.seek((self.count - 1) * ITEMSIZE["ts"])
+                (self.last_ts,) = struct.unpack(COLUMNS["ts"], f.read(ITEMSIZE["ts"]))
+
+    def append(self, timestamp, zone, severity):
+        if self.files is None:
+            self.files = {}
+            for col, path in self.paths.items():
+                f = open(path, "ab")
+                # Drop any partial tail left behind by a crash
+                f.truncate(self.count * ITEMSIZE[col])
+                self.files[col] = f
+        self.files["ts"].write(struct.pack(COLUMNS["ts"], timestamp))
+        self.files["zone"].write(struct.pack(COLUMNS["zone"], zone))
+        self.files["sev"].write(struct.pack(COLUMNS["sev"], severity))
+        # Hand the record to the OS right away so a crash loses at most this one
+        self.flush()
+        if self.count == 0:
+            self.first_ts = timestamp
+        self.last_ts = timestamp
+        self.count += 1
+        # Mappings taken before this append are now too short
+        self.maps = None
+
+    def flush(self):
+        if self.files is not None:
+            for f in self.files.values():
+                f.flush()
+
+    def close(self):
+        if self.files is not None:
+            for f in self.files.values():
+                f.close()
+            self.files = None
+        self.maps = None
+
+    def column(self, col):
+        """Read-only memory map of the first `count` records of a column"""
+        import numpy as np
+
+        if self.maps is None:
+            self.maps = {
+                name: np.memmap(path, dtype=COLUMNS[name], mode="r", shape=(self.count,))
+                for name, path in self.paths.items()
+            }
+        return self.maps[col]
+
+
+class PerceptStore:
+    """Append-only, memory-mapped history of (timestamp, zone, severity) percepts"""
+
+    def __init__(self, directory, segment_size=SEGMENT_SIZE):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+
+        numbers = sorted({int(path.stem.split("-")[1]) for path in self.directory.glob("seg-*.ts")})
+        self.segments = [Segment(self.directory, n) for n in numbers]
+        if not self.segments:
+            self.segments.append(Segment(self.directory, 0))
+
+    def __len__(self):
+        return sum(segment.count for segment in self.segments)
+
+    def append(self, timestamp, zone, severity):
+        """Record one percept; timestamps are kept non-decreasing for range search"""
+        active = self.segments[-1]
+        if active.count >= self.segment_size:
+            active.close()
+            # Number after the last segment, not by position - a missing
+            # segment file would otherwise make us reopen a later one
+            active = Segment(self.directory, active.number + 1)
+            self.segments.append(active)
+
+        last_ts = next((s.last_ts for s in reversed(self.segments) if s.count), None)
+        if last_ts is not None and timestamp < last_ts:
+            timestamp = last_ts
+        active.append(timestamp, zone, severity)
+
+    def flush(self):
+        self.segments[-1].flush()
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+
+    def _slices(self, start=None, end=None, zone=None):
+        """Yield the severity values of each segment matching the query"""
+        import numpy as np
+
+        for segment in self.segments:
+            if segment.count == 0:
+                continue
+            # Skip segments entirely outside the time range using the index
+            if start is not None and segment.last_ts < start:
+                continue
+            if end is not None and segment.first_ts >= end:
+                continue
+
+            ts = segment.column("ts")
+            lo = 0 if start is None else int(np.searchsorted(ts, start, side="left"))
+            hi = segment.count if end is None else int(np.searchsorted(ts, end, side="left"))
+            if lo >= hi:
+                continue
+
+            sev = segment.column("sev")[lo:hi]
+            if zone is not None:
+                sev = sev[segment.column("zone")[lo:hi] == zone]
+            if sev.size:
+                yield sev
+
+    def severities(self, start=None, end=None, zone=None):
+        """Severity values in [start, end) for an optional zone, as one array"""
+        import numpy as np
+
+        parts = list(self._slices(start, end, zone))
+        if not parts:
+            return np.empty(0, COLUMNS["sev"])
+        return np.concatenate(parts)
+
+    def max_severity(self, start=None, end=None, zone=None):
+        """Highest severity in [start, end), or None if there are no readings"""
+        maxima = [int(sev.max()) for sev in self._slices(start, end, zone)]
+        return max(maxima) if maxima else None
+
+    def mean_severity(self, start=None, end=None, zone=None):
+        """Average severity in [start, end), or None if there are no readings"""
+        import numpy as np
+
+        total = 0
+        count = 0
+        for sev in self._slices(start, end, zone):
+            total += int(sev.sum(dtype=np.uint64))
+            count += sev.size
+        return total / count if count else None
+
+    def count_above(self, threshold, start=None, end=None, zone=None):
+        """Number of readings in [start, end) with severity strictly above threshold"""
+        import numpy as np
+
+        return sum(int(np.count_nonzero(sev > threshold)) for sev in self._slices(start, end, zone))
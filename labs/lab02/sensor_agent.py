@@ -1,12 +1,15 @@
 import asyncio
 import random
+import time
 from datetime import datetime
+from pathlib import Path
 from spade.agent import Agent
 from spade.behaviour import PeriodicBehaviour
 from colorama import Fore, Style, init
+from percept_store import PerceptStore
 
-# Initialize colorama
-init(autoreset=True)
+# Percept history is kept next to this script, one folder per agent
+PERCEPT_DIR = Path(__file__).resolve().parent / "percepts"
 
 # This class simulates the 'Perception' part of the agent
 class MonitorDisaster(PeriodicBehaviour):
@@ -16,8 +19,13 @@ class MonitorDisaster(PeriodicBehaviour):
         severities = ["Normal", "Low", "Medium", "High", "Catastrophic"]
         current_percept = random.choice(severities)
         level = severities.index(current_percept)
+        zone = random.randint(1, 5)
         
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        now = time.time()
+        timestamp = datetime.fromtimestamp(now).strftime("%H:%M:%S")
+
+        # MEMORY: Keep every percept so trends can be queried later
+        self.agent.percepts.append(now, zone, level)
 
         # LOGGING: This satisfies the 'Event Logs' deliverable
         # Color coding based on severity
@@ -30,18 +38,30 @@ class MonitorDisaster(PeriodicBehaviour):
         else:
             color = Fore.RED
         
-        print(f"{color}[{timestamp}] PERCEPT RECEIVED: Damage Level is {current_percept} ({level}){Style.RESET_ALL}")
+        print(f"{color}[{timestamp}] PERCEPT RECEIVED: Zone-{zone} Damage Level is {current_percept} ({level}){Style.RESET_ALL}")
 
         # REACTIVE LOGIC: Simple response to perception
         if level >= 3:
             print(f"{Fore.RED}{Style.BRIGHT}--- [ALERT] High Severity Detected! Initializing Emergency Protocol ---{Style.RESET_ALL}")
+            # TREND: How has this zone looked over the last hour?
+            hour_ago = now - 3600
+            high_count = self.agent.percepts.count_above(2, start=hour_ago, zone=zone)
+            mean_level = self.agent.percepts.mean_severity(start=hour_ago, zone=zone)
+            print(f"{Fore.RED}--- [HISTORY] Zone-{zone} last hour: {high_count} high-severity percepts, mean level {mean_level:.2f} ---{Style.RESET_ALL}")
 
 class SensorAgent(Agent):
     async def setup(self):
         print(f"{Fore.CYAN}SensorAgent {self.jid} started. Monitoring environment...{Style.RESET_ALL}")
+        self.percepts = PerceptStore(PERCEPT_DIR / str(self.jid).split("@")[0])
+        print(f"{Fore.CYAN}Percept history loaded: {len(self.percepts)} readings on record{Style.RESET_ALL}")
         # Check the environment every 3 seconds
         self.add_behaviour(MonitorDisaster(period=3))
 
+    async def stop(self):
+        await super().stop()
+        # Flush and release the segment files once no behaviour can append
+        self.percepts.close()
+
 async def main():
     jid = "sensor_agent@localhost"
     password = "password"
@@ -69,6 +89,8 @@ async def main():
     print(f"{Fore.CYAN}--- [SYSTEM] Monitoring complete. ---{Style.RESET_ALL}")
 
 if __name__ == "__main__":
+    # Initialize colorama only when run as a script, not when imported by agent_runtime.py
+    init(autoreset=True)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
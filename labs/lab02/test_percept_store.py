@@ -0,0 +1,100 @@
+import pytest
+
+from percept_store import ITEMSIZE, PerceptStore
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def store(tmp_path):
+    # 10 readings per segment so rollover is cheap to exercise
+    store = PerceptStore(tmp_path, segment_size=10)
+    for i in range(25):
+        store.append(1000.0 + i, i % 5 + 1, i % 5)
+    yield store
+    store.close()
+
+
+def test_aggregates_over_whole_history(store):
+    assert len(store) == 25
+    assert store.max_severity() == 4
+    assert store.mean_severity() == 2.0
+    assert store.count_above(2) == 10
+
+
+def test_range_is_half_open(store):
+    # Readings at t=1000, 1001, 1002 - end is exclusive
+    assert list(store.severities(start=1000, end=1003)) == [0, 1, 2]
+    assert list(store.severities(start=1003, end=1003)) == []
+    assert list(store.severities(start=1022)) == [2, 3, 4]
+    assert store.max_severity(end=1000) is None
+    assert store.mean_severity(start=2000) is None
+
+
+def test_range_spanning_segments(store):
+    assert len(store.segments) == 3
+    assert list(store.severities(start=1008, end=1012)) == [3, 4, 0, 1]
+
+
+def test_zone_filter(store):
+    # Zone n always carries severity n - 1
+    assert store.max_severity(zone=3) == 2
+    assert store.mean_severity(zone=3) == 2.0
+    assert store.count_above(0, zone=1) == 0
+    assert store.count_above(1, start=1010, end=1020, zone=4) == 2
+    assert store.max_severity(zone=9) is None
+
+
+def test_timestamps_never_go_backwards(store):
+    store.append(10.0, 1, 4)
+    assert list(store.severities(start=1024)) == [4, 4]
+
+
+def test_reopen_keeps_history(store, tmp_path):
+    store.close()
+    reopened = PerceptStore(tmp_path, segment_size=10)
+    assert len(reopened) == 25
+    assert [s.first_ts for s in reopened.segments] == [1000.0, 1010.0, 1020.0]
+    reopened.append(2000.0, 2, 3)
+    assert len(reopened) == 26
+    assert reopened.max_severity(start=2000) == 3
+    reopened.close()
+
+
+def test_appends_are_on_disk_without_close(store, tmp_path):
+    # A second reader sees every record even though the writer never closed
+    assert len(PerceptStore(tmp_path, segment_size=10)) == 25
+
+
+def test_partial_tail_is_dropped(store, tmp_path):
+    store.close()
+    # Simulate a crash midway through writing a record
+    with open(tmp_path / "seg-00002.ts", "ab") as f:
+        f.write(b"\x00" * (ITEMSIZE["ts"] - 3))
+    with open(tmp_path / "seg-00002.zone", "ab") as f:
+        f.write(b"\x01\x00")
+
+    reopened = PerceptStore(tmp_path, segment_size=10)
+    assert len(reopened) == 25
+    reopened.append(3000.0, 1, 4)
+    reopened.close()
+
+    reopened = PerceptStore(tmp_path, segment_size=10)
+    assert len(reopened) == 26
+    assert list(reopened.severities(start=1024)) == [4, 4]
+    reopened.close()
+
+
+def test_rollover_after_missing_segment(store, tmp_path):
+    store.close()
+    for col in ("ts", "zone", "sev"):
+        (tmp_path / f"seg-00001.{col}").unlink()
+
+    reopened = PerceptStore(tmp_path, segment_size=10)
+    assert [s.number for s in reopened.segments] == [0, 2]
+    for i in range(6):
+        reopened.append(2000.0 + i, 1, 3)
+    assert [s.number for s in reopened.segments] == [0, 2, 3]
+    assert [s.count for s in reopened.segments] == [10, 10, 1]
+    assert list(reopened.severities(start=1020, end=1030)) == [0, 1, 2, 3, 4]
+    reopened.close()
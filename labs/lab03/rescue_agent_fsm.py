@@ -15,18 +15,25 @@ FSM States:
 - RESPONDING: Moving to disaster location
 - RESCUE: Actively performing rescue operations
 - COMPLETED: Mission completed, returning to base
+
+Checkpointing:
+The agent snapshots its FSM state, current event and mission counter to
+checkpoints/<agent>.ckpt every few seconds and on shutdown. A restarted agent
+resumes from the last snapshot instead of starting over at IDLE.
 """
 
 import asyncio
 import random
+import sys
 from datetime import datetime
+from pathlib import Path
 from enum import Enum
-from spade.agent import Agent
 from spade.behaviour import PeriodicBehaviour, State, FSMBehaviour
 from colorama import Fore, Style, init
 
-# Initialize colorama
-init(autoreset=True)
+# Shared checkpoint helpers live in labs/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from checkpoint import CheckpointedAgent
 
 # Define FSM States
 class States(Enum):
@@ -141,6 +148,8 @@ class CompletedState(State):
         else:
             # End FSM after max missions
             print(f"{Fore.CYAN}[{timestamp}] 🛑 Maximum missions reached. Agent shutting down.{Style.RESET_ALL}")
+            # All missions done - the next run should start fresh
+            await self.agent.clear_checkpoint()
             await self.agent.stop()
 
 class RescueAgentFSM(FSMBehaviour):
@@ -164,7 +173,39 @@ class RescueAgentFSM(FSMBehaviour):
         print(f"{Fore.CYAN}{Style.BRIGHT}{'='*70}{Style.RESET_ALL}\n")
         await self.agent.stop()
 
-class RescueAgent(Agent):
+class RescueAgent(CheckpointedAgent):
+    checkpoint_fields = ("missions_completed",)
+
+    def snapshot(self):
+        """Add the FSM state and current event to the saved counters"""
+        snapshot = super().snapshot()
+        event = self.current_event
+        if event is not None:
+            event = (event.type, event.severity, event.location, event.timestamp)
+        snapshot["current_event"] = event
+        snapshot["fsm_state"] = self.fsm.current_state
+        return snapshot
+
+    def restore(self, snapshot):
+        """Rebuild the current event and FSM position from a snapshot"""
+        # Decode everything first so a bad snapshot leaves the agent untouched
+        event = None
+        if snapshot["current_event"] is not None:
+            event_type, severity, location, event_time = snapshot["current_event"]
+            event = Event(event_type, severity, location)
+            event.timestamp = event_time
+
+        state = snapshot["fsm_state"]
+        if state not in [s.value for s in States]:
+            raise ValueError(f"unknown FSM state {state!r}")
+        if state in (States.ALERT.value, States.RESPONDING.value, States.RESCUE.value) and event is None:
+            # Can't continue a mission without knowing where it is
+            state = States.MONITORING.value
+
+        super().restore(snapshot)
+        self.current_event = event
+        self.fsm.current_state = state
+
     async def setup(self):
         print(f"{Fore.CYAN}🤖 RescueAgent {self.jid} initialized{Style.RESET_ALL}\n")
         
@@ -175,6 +216,7 @@ class RescueAgent(Agent):
         
         # Create FSM behaviour
         fsm = RescueAgentFSM()
+        self.fsm = fsm
         
         # Add states to FSM
         fsm.add_state(States.IDLE.value, IdleState(), initial=True)
@@ -193,6 +235,10 @@ class RescueAgent(Agent):
         fsm.add_transition(States.RESCUE.value, States.COMPLETED.value)
         fsm.add_transition(States.COMPLETED.value, States.MONITORING.value)
         
+        # Resume from the last snapshot, if a previous run left one
+        if self.start_checkpointing():
+            print(f"{Fore.CYAN}♻️  Resumed from checkpoint: state={fsm.current_state}, missions={self.missions_completed}{Style.RESET_ALL}\n")
+        
         self.add_behaviour(fsm)
 
 async def main():
@@ -214,11 +260,17 @@ async def main():
             await asyncio.sleep(1)
         except KeyboardInterrupt:
             break
+        except asyncio.CancelledError:
+            # Ctrl+C under asyncio.run arrives here - stop() writes the final snapshot
+            await agent.stop()
+            raise
     
     await agent.stop()
     print(f"\n{Fore.CYAN}Agent shutdown complete.{Style.RESET_ALL}")
 
 if __name__ == "__main__":
+    # Initialize colorama only when run as a script, not when imported by agent_runtime.py
+    init(autoreset=True)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -15,20 +15,27 @@ Agents:
 FIPA-ACL Performatives Used:
 - INFORM: Share intelligence, status updates, alerts
 - REQUEST: Ask for specific actions, data, or exploits
+
+Checkpointing:
+MainHacker and Watchdog snapshot their counters to checkpoints/<agent>.ckpt
+periodically and on shutdown. If a run crashes or is interrupted, the next run
+picks the counters back up; a run that reaches its planned end deletes them.
 """
 
 import asyncio
 import random
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
 from spade.agent import Agent
 from spade.behaviour import CyclicBehaviour
 from spade.message import Message
-from spade.template import Template
 from colorama import Fore, Style, init
 
-# Initialize colorama
-init(autoreset=True)
+# Shared checkpoint helpers live in labs/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from checkpoint import CheckpointedAgent
 
 # Message logger
 MESSAGE_LOG = []
@@ -224,9 +231,11 @@ class ReconAgent(Agent):
         self.add_behaviour(recon_behaviour)
 
 
-class MainHackerAgent(Agent):
+class MainHackerAgent(CheckpointedAgent):
     """Main coordinator agent"""
     
+    checkpoint_fields = ("operations_planned", "operations_executed", "successful_ops")
+    
     def __init__(self, jid, password):
         super().__init__(jid, password)
         self.operations_planned = 0
@@ -235,13 +244,17 @@ class MainHackerAgent(Agent):
     
     async def setup(self):
         print(f"{Fore.RED}💀 MainHacker initialized - Command center online{Style.RESET_ALL}")
+        if self.start_checkpointing():
+            print(f"{Fore.WHITE}♻️  MainHacker resumed from checkpoint: {self.operations_planned} planned, {self.operations_executed} executed, {self.successful_ops} successful{Style.RESET_ALL}")
         main_behaviour = MainHackerBehaviour()
         self.add_behaviour(main_behaviour)
 
 
-class WatchdogAgent(Agent):
+class WatchdogAgent(CheckpointedAgent):
     """Security monitoring agent"""
     
+    checkpoint_fields = ("current_heat", "alerts_sent")
+    
     def __init__(self, jid, password):
         super().__init__(jid, password)
         self.current_heat = 0
@@ -249,6 +262,8 @@ class WatchdogAgent(Agent):
     
     async def setup(self):
         print(f"{Fore.YELLOW}🛡️  Watchdog initialized - Monitoring security infrastructure{Style.RESET_ALL}")
+        if self.start_checkpointing():
+            print(f"{Fore.WHITE}♻️  Watchdog resumed from checkpoint: heat {self.current_heat}%, {self.alerts_sent} alerts sent{Style.RESET_ALL}")
         watchdog_behaviour = WatchdogBehaviour()
         self.add_behaviour(watchdog_behaviour)
 
@@ -283,10 +298,19 @@ async def main():
     
     # Run for demo period
     print(f"{Fore.MAGENTA}🚀 Collective operational - Running for 40 seconds...\n{Style.RESET_ALL}")
-    await asyncio.sleep(40)
+    try:
+        await asyncio.sleep(40)
+    except asyncio.CancelledError:
+        # Interrupted - stop() snapshots the counters so the next run resumes them
+        await recon.stop()
+        await hacker.stop()
+        await watchdog.stop()
+        raise
     
-    # Shutdown
+    # Shutdown - the demo reached its planned end, so the next run starts fresh
     print(f"\n{Fore.YELLOW}⏹️  Initiating shutdown sequence...{Style.RESET_ALL}")
+    await hacker.clear_checkpoint()
+    await watchdog.clear_checkpoint()
     await recon.stop()
     await hacker.stop()
     await watchdog.stop()
@@ -302,6 +326,8 @@ async def main():
     print(f"{Fore.GREEN}  • Successful Exploits: {hacker.successful_ops}")
     print(f"{Fore.YELLOW}  • Security Alerts: {watchdog.alerts_sent}")
     print(f"{Fore.MAGENTA}  • Total Messages: {len(MESSAGE_LOG)}\n")
+    if hacker.resumed or watchdog.resumed:
+        print(f"{Fore.WHITE}  ♻️  Counters include progress restored from an interrupted run; the message log covers this run only\n")
     
     # Print message log
     print(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
@@ -318,6 +344,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Initialize colorama only when run as a script, not when imported by agent_runtime.py
+    init(autoreset=True)
     try:
         asyncio.run(main())
     except KeyboardInterrupt: